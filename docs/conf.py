@@ -5,10 +5,18 @@
 
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
+import hashlib
+import json
 import os
 import sys
+from pathlib import Path
 sys.path.insert(0, os.path.abspath('../'))
 
+# tutorial notebooks are maintained as jupytext .py files in /notebooks and
+# converted to .ipynb files in docs/notebooks for rendering by nbsphinx.
+NOTEBOOK_SRC_DIR = Path(__file__).parent.parent / 'notebooks'
+NOTEBOOK_OUT_DIR = Path(__file__).parent / 'notebooks'
+
 project = "sensingcluespy"
 copyright = "2024, SensingClues"
 author = "SensingClues"
@@ -18,8 +26,110 @@ release = "0.2.3"
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
 
+def _write_if_changed(path: Path, content: bytes) -> bool:
+    """Write content to path, but only if it differs from the current file
+
+    Leaving identical files untouched keeps their mtime stable, so Sphinx'
+    incremental build does not re-process unchanged notebooks.
+
+    :param path: Location to write the content to.
+    :param content: New content for the file.
+    :returns: True if the file was (re)written, False if it was up to date.
+    """
+    if path.exists() and path.read_bytes() == content:
+        return False
+    path.write_bytes(content)
+    return True
+
+
+def _stored_source_hash(ipynb_path: Path):
+    """Read the source hash recorded in a generated notebook, if any
+
+    :param ipynb_path: Location of a generated .ipynb file.
+    :returns: The sha256 hash of the paired .py file at the time the
+        notebook was generated, or None if it cannot be determined.
+    """
+    try:
+        metadata = json.loads(ipynb_path.read_text('utf-8'))['metadata']
+    except (OSError, ValueError, KeyError):
+        return None
+    return metadata.get('jupytext', {}).get('source_hash')
+
+
+def _merge_cell_outputs(notebook, ipynb_path: Path):
+    """Carry stored outputs over to unchanged code cells
+
+    The .py sources do not store outputs, so a plain conversion would
+    strip every example table and map from the rendered docs (nbsphinx
+    does not execute the notebooks). Outputs from the previously
+    generated notebook are therefore kept for code cells whose source
+    is unchanged; edited cells lose their stale outputs.
+
+    :param notebook: Freshly converted notebook to merge outputs into.
+    :param ipynb_path: Location of the previously generated .ipynb.
+    """
+    from nbformat import from_dict
+
+    try:
+        existing = json.loads(ipynb_path.read_text('utf-8'))
+    except (OSError, ValueError):
+        return
+    stored = {}
+    for cell in existing.get('cells', []):
+        if cell.get('cell_type') != 'code' or not cell.get('outputs'):
+            continue
+        source = cell.get('source', '')
+        if isinstance(source, list):
+            source = ''.join(source)
+        # keep outputs per occurrence, for repeated identical cells.
+        stored.setdefault(source, []).append(cell)
+    for cell in notebook.cells:
+        if cell.cell_type != 'code':
+            continue
+        matches = stored.get(cell.source)
+        if matches:
+            match = matches.pop(0)
+            cell.outputs = [from_dict(out) for out in match['outputs']]
+            cell.execution_count = match.get('execution_count')
+
+
+def _sync_tutorial_notebooks(app):
+    """Convert paired jupytext .py notebooks to .ipynb for nbsphinx
+
+    The hash of the .py source is recorded in the generated notebook's
+    jupytext metadata. Conversion is skipped when that hash is still
+    current, and the output is only written when its content actually
+    changed, so unchanged notebooks keep their mtime and Sphinx'
+    incremental build leaves them alone. The hash guard is robust
+    against fresh checkouts, where mtimes carry no information.
+    """
+    try:
+        import jupytext
+    except ImportError:
+        # jupytext is a dev requirement; fall back to the committed .ipynb.
+        return
+
+    for py_path in sorted(NOTEBOOK_SRC_DIR.glob('*.py')):
+        ipynb_path = NOTEBOOK_OUT_DIR / (py_path.stem + '.ipynb')
+        source_hash = hashlib.sha256(py_path.read_bytes()).hexdigest()
+        if (ipynb_path.exists()
+                and source_hash == _stored_source_hash(ipynb_path)):
+            continue
+        notebook = jupytext.read(py_path)
+        if ipynb_path.exists():
+            _merge_cell_outputs(notebook, ipynb_path)
+        notebook.metadata.setdefault('jupytext', {})
+        notebook.metadata['jupytext']['source_hash'] = source_hash
+        content = jupytext.writes(notebook, fmt='ipynb').encode('utf-8')
+        _write_if_changed(ipynb_path, content)
+
+
 def setup(app):  # custom css is used to change the css used
     app.add_css_file('css/custom.css')
+    app.connect('builder-inited', _sync_tutorial_notebooks)
+    # declare this conf-module parallel-safe, so sphinx-build can fan out
+    # the reading and writing phases over multiple processes (-j auto).
+    return {'parallel_read_safe': True, 'parallel_write_safe': True}
 
 
 extensions = [
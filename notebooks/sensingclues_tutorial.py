@@ -144,6 +144,39 @@ tracks_geo = sensing_clues.add_geojson_to_tracks(tracks)
 hierarchy = sensing_clues.get_hierarchy(scope="SCCSS")
 hierarchy.info()
 
+# #### Optional: cache the hierarchy on disk
+#
+# The hierarchy rarely changes, but is fetched from the API on every run of this notebook. If you rerun the notebook often, you can cache it on disk (requires `pyarrow` for the parquet format) and only refetch once the cache is older than a day, or when passing `refresh=True`.
+
+# +
+import time
+from pathlib import Path
+
+import pandas as pd
+
+HIERARCHY_CACHE_TTL = 24 * 3600  # seconds
+
+
+def get_hierarchy_cached(scope: str, refresh: bool = False) -> pd.DataFrame:
+    """Load the hierarchy from a local cache, or fetch and cache it"""
+    cache_path = Path(
+        f"~/.cache/sensingcluespy/hierarchy_{scope}.parquet"
+    ).expanduser()
+    cache_is_fresh = (
+        cache_path.exists()
+        and time.time() - cache_path.stat().st_mtime < HIERARCHY_CACHE_TTL
+    )
+    if cache_is_fresh and not refresh:
+        return pd.read_parquet(cache_path)
+    hierarchy = sensing_clues.get_hierarchy(scope=scope)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    hierarchy.to_parquet(cache_path)
+    return hierarchy
+
+
+hierarchy = get_hierarchy_cached(scope="SCCSS")
+# -
+
 # ### Get details for specific concepts in the hierarchy
 #
 # You can get information on children or the parents of a concept in the hierarchy by filtering on its label or id. Use the available helper functions to do so. For example, you could do the following for the concept of a "Kite" (oid = "https://sensingclues.poolparty.biz/SCCSSOntology/222"):
@@ -179,8 +212,13 @@ children_label
 
 
 # #### What are the details for these children?
+#
+# Index the hierarchy by id once; lookups on the index hit a precomputed hash table, whereas `isin` rebuilds a hash set from the full id-column on every call.
 
-hierarchy.loc[hierarchy["id"].isin(children_label)]
+# +
+hierarchy_by_id = hierarchy.set_index("id", drop=False)
+hierarchy_by_id.loc[hierarchy_by_id.index.intersection(children_label)]
+# -
 
 # ### Filter observations on concept
 #
@@ -210,6 +248,16 @@ observations = sensing_clues.get_observations(
 
 observations.head()
 
+# Columns like `observationType` and `conceptLabel` only hold a handful of distinct values, but are used as filter and grouping keys throughout this notebook. Casting them to the categorical dtype dictionary-encodes them, so comparisons and groupbys run on small integer codes and the columns take up far less memory.
+
+# +
+cat_cols = ["observationType", "conceptLabel", "entityType"]
+observations = observations.astype(
+    {col: "category" for col in cat_cols if col in observations.columns}
+)
+observations.dtypes
+# -
+
 # ### Count concepts related to observations
 #
 # Get the number of observations per concept in the ontology (hierarchy).
@@ -238,26 +286,40 @@ concept_counts.head()
 # -
 
 import matplotlib.pyplot as plt
-plt.style.use("ggplot")
 
 min_freq = 10
 if not concept_counts.empty:
-    concept_freq = concept_counts.merge(
-        hierarchy, left_on="_value", right_on="id", how="left"
-    )
-    concept_freq["label"] = concept_freq["label"].fillna(concept_freq["_value"])
-    concept_freq = concept_freq.set_index("label")["frequency"].sort_values(
-        ascending=True
+    # look up labels via a dict instead of merging the full
+    # hierarchy-dataframe; ids without a label keep their URI. The map
+    # is cached on the hierarchy itself, so rerunning this cell (or
+    # reusing it elsewhere) does not rebuild it.
+    label_map = hierarchy.attrs.get("label_map")
+    if label_map is None:
+        label_map = dict(
+            zip(hierarchy["id"].to_numpy(), hierarchy["label"].to_numpy())
+        )
+        hierarchy.attrs["label_map"] = label_map
+    concept_freq = (
+        concept_counts.assign(
+            label=concept_counts["_value"]
+            .map(label_map)
+            .fillna(concept_counts["_value"])
+        )
+        .set_index("label")["frequency"]
+        .sort_values(ascending=True)
     )
 
-    concept_freq.loc[concept_freq >= min_freq].plot(kind="barh")
-    plt.title(
-        f"Number of observations per concept in group(s)\n'{groups}' for label '{label}'\n"
-        f"[{date_from} to {date_until} and minimum frequency {min_freq}]",
-        fontsize=12,
-    )
-    plt.xlabel("Number of observations per concept label")
-    plt.ylabel("Label of concept")
+    # apply the ggplot style to this figure only, instead of mutating
+    # the global rcParams for the whole session via plt.style.use.
+    with plt.style.context("ggplot"):
+        concept_freq.loc[concept_freq >= min_freq].plot(kind="barh")
+        plt.title(
+            f"Number of observations per concept in group(s)\n'{groups}' for label '{label}'\n"
+            f"[{date_from} to {date_until} and minimum frequency {min_freq}]",
+            fontsize=12,
+        )
+        plt.xlabel("Number of observations per concept label")
+        plt.ylabel("Label of concept")
 
 # ### Get layers
 
@@ -279,13 +341,189 @@ layer.head()
 # # !pip install folium
 # -
 
+# +
+# folium is not a dependency of sensingcluespy itself; it is only
+# imported here, so the data-extraction cells above do not pay its
+# import cost and can run without it.
+from importlib.util import find_spec
+
+if find_spec("folium") is None:
+    raise ModuleNotFoundError(
+        "folium is not installed; run '!pip install folium' first."
+    )
 import folium
+# -
+
+# +
+import geopandas as gpd
 
 poly_map = folium.Map([51.9244, 4.4777], zoom_start=8, tiles="cartodbpositron")
-for _, geometry in layer["geometry"].items():
-    folium.GeoJson(geometry).add_to(poly_map)
+# serialize all geometries to a single GeoJSON FeatureCollection at
+# once, instead of converting and adding each geometry separately.
+folium.GeoJson(gpd.GeoDataFrame(layer[["geometry"]]).to_json()).add_to(
+    poly_map
+)
 folium.LatLngPopup().add_to(poly_map)
 poly_map
+# -
+
+# #### Plot the geometries of tracks
+#
+# If you added geojson-data to the tracks, their geometries can be plotted in the same way, again serializing the whole set of geometries in one pass.
+
+# +
+tracks_with_geo = gpd.GeoDataFrame(
+    tracks_geo.loc[tracks_geo["geometry"].notna()], geometry="geometry"
+)
+minx, miny, maxx, maxy = tracks_with_geo.total_bounds
+track_map = folium.Map(
+    [(miny + maxy) / 2, (minx + maxx) / 2],
+    zoom_start=8,
+    tiles="cartodbpositron",
+)
+folium.GeoJson(tracks_with_geo[["geometry"]].to_json()).add_to(track_map)
+track_map
+# -
+
+# #### Plot tracks on a static map
+#
+# For a static overview, you can draw the tracks over country outlines, for instance the Natural Earth countries dataset (geopandas no longer ships it, so it is fetched from naturalearthdata.com). The `.cx`-accessor selects only the geometries intersecting the bounding box via the spatial index, instead of clipping against every country polygon.
+
+# +
+world = gpd.read_file(
+    "https://naturalearth.s3.amazonaws.com/110m_cultural/"
+    "ne_110m_admin_0_countries.zip"
+)
+with plt.style.context("ggplot"):
+    ax = world.cx[minx:maxx, miny:maxy].plot(
+        color="white", edgecolor="black", figsize=(10, 10)
+    )
+    tracks_with_geo.plot(ax=ax, color="red")
+    plt.show()
+# -
+
+# ### Visualize observations on a map
+#
+# You can also plot the extracted observations themselves, with a marker per observation. The observations contain their location in the `where`-column. First, convert the dataframe to a `geopandas.GeoDataFrame`, so the coordinates are available as a geometry-column.
+
+# +
+import geopandas as gpd
+from shapely.geometry import shape
+
+observations_geo = gpd.GeoDataFrame(
+    observations,
+    geometry=[shape(where) for where in observations["where"]],
+    crs="EPSG:4326",
+)
+# -
+
+# Rather than iterating the dataframe row-by-row with `iterrows()`, extract the coordinates, observation types and concept labels as plain arrays once, and look up the marker format per observation type in a dictionary. This keeps the loop itself cheap, which matters once you plot thousands of observations.
+#
+# The marker data, the map construction and the rendering are kept in separate cells on purpose: when you only tweak the map itself, rerunning its cell reuses the arrays from the first cell instead of recomputing them.
+
+# +
+import numpy as np
+
+# marker format per observation type. A dict lookup avoids a
+# per-row if/elif chain on observationType.
+ICON_FMT = {
+    "animal": {"icon": "fa-paw", "color": "orange"},
+    "community": {"icon": "fa-people-group", "color": "darkblue"},
+    "community_work": {"icon": "fa-people-group", "color": "darkblue"},
+    "hwc": {"icon": "fa-triangle-exclamation", "color": "red"},
+    "poi": {"icon": "fa-leaf", "color": "darkgreen"},
+}
+DEFAULT_FMT = {"icon": "fa-circle", "color": "blue"}
+
+xs = observations_geo.geometry.x.to_numpy()
+ys = observations_geo.geometry.y.to_numpy()
+types = observations_geo["observationType"].to_numpy()
+labels = observations_geo["conceptLabel"].to_numpy()
+# -
+
+# Build the map and add a marker per observation to the feature group of its observation type.
+
+# +
+obs_map = folium.Map(
+    [np.mean(ys), np.mean(xs)], zoom_start=8, tiles="cartodbpositron"
+)
+feature_groups = {t: folium.FeatureGroup(name=t) for t in np.unique(types)}
+for fg in feature_groups.values():
+    obs_map.add_child(fg)
+
+for x, y, t, lbl in zip(xs, ys, types, labels):
+    folium.Marker(
+        [y, x],
+        lbl,
+        icon=folium.Icon(**ICON_FMT.get(t, DEFAULT_FMT), prefix="fa"),
+    ).add_to(feature_groups[t])
+
+folium.LayerControl().add_to(obs_map)
+# -
+
+obs_map
+
+# #### Alternative: cluster markers for large numbers of observations
+#
+# With many thousands of observations, a `folium.Marker` per observation makes the map slow to build and heavy to render in the browser. `FastMarkerCluster` ships the marker data as one array plus a single JavaScript callback that formats the icons client-side, so the generated HTML stays small.
+
+# +
+from folium.plugins import FastMarkerCluster
+
+callback = """
+function (row) {
+    var icon = L.AwesomeMarkers.icon(
+        {icon: row[3], prefix: 'fa', markerColor: row[4]}
+    );
+    return L.marker(new L.LatLng(row[0], row[1]), {icon: icon})
+        .bindPopup(row[2]);
+}
+"""
+marker_data = [
+    [y, x, lbl, fmt["icon"], fmt["color"]]
+    for y, x, t, lbl in zip(ys, xs, types, labels)
+    for fmt in (ICON_FMT.get(t, DEFAULT_FMT),)
+]
+
+cluster_map = folium.Map(
+    [np.mean(ys), np.mean(xs)], zoom_start=8, tiles="cartodbpositron"
+)
+FastMarkerCluster(marker_data, callback=callback).add_to(cluster_map)
+cluster_map
+# -
+
+# ### Show a heatmap of the observations
+#
+# Instead of individual markers, you can summarize the observations in a heatmap. Set `show_heatmap` to "all" to include all observations, or to "hwc_animal" to overlay human-wildlife conflicts (hwc) on animal sightings.
+#
+# The coordinate pairs are built with `np.column_stack` on the vectorized `GeoSeries.y/.x` accessors, which runs in compiled code, rather than with a Python lambda per geometry (`.apply(lambda geom: [geom.y, geom.x])`).
+
+# +
+from folium.plugins import HeatMap
+
+show_heatmap = "hwc_animal"
+
+heat_map = folium.Map(
+    [np.mean(ys), np.mean(xs)], zoom_start=8, tiles="cartodbpositron"
+)
+
+# reuse the xs/ys/types arrays extracted for the marker map; boolean
+# masks on the precomputed coordinate array replace repeated .loc
+# scans of the full dataframe per observation type.
+latlon = np.column_stack([ys, xs])
+if show_heatmap == "all":
+    HeatMap(latlon).add_to(heat_map)
+elif show_heatmap == "hwc_animal":
+    HeatMap(
+        latlon[types == "hwc"],
+        gradient={0.4: "yellow", 0.65: "orange", 1: "red"},
+    ).add_to(heat_map)
+    HeatMap(
+        latlon[types == "animal"],
+        gradient={0.4: "blue", 0.65: "lime", 1: "green"},
+    ).add_to(heat_map)
+heat_map
+# -
 
 
 
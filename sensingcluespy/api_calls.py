@@ -3,15 +3,20 @@
 import io
 import math
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union
 
 import geopandas
 import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from shapely.geometry import box, shape
+from urllib3.util.retry import Retry
 
 from sensingcluespy import sclogging
 from sensingcluespy.src import DataExtractor, align_extractor, make_query
+from sensingcluespy.src.cache import disk_cached
 from sensingcluespy.src.exceptions import (
     SCClientNotFoundError, SCPermissionDenied, SCServiceUnavailable,
 )
@@ -24,6 +29,20 @@ ALLOWED_REQUEST_TYPES = ["post", "get"]
 DEFAULT_EXCLUDE_PIDS = ["track", "default"]
 
 
+def _bbox_contains(outer: dict, inner: dict) -> bool:
+    """Check whether bounding box ``inner`` lies within ``outer``
+
+    Both arguments are coordinate dictionaries with keys north, south,
+    east and west, as accepted by the coord-kwarg of get_observations().
+    """
+    return (
+        inner["north"] <= outer["north"]
+        and inner["south"] >= outer["south"]
+        and inner["east"] <= outer["east"]
+        and inner["west"] >= outer["west"]
+    )
+
+
 class SensingClues(object):
     """Class to extract various types of SensingClues-data"""
 
@@ -34,6 +53,23 @@ class SensingClues(object):
         :param password: Password for SensingClues Focus
         """
         self.session = requests.Session()
+        # mount an adapter with a connection pool, so consecutive
+        # (paginated) calls reuse keep-alive connections instead of
+        # paying a new TLS handshake per request. Transient connection
+        # errors are retried with a small backoff.
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        self.session.mount("https://", adapter)
+        # cache of url -> (etag, response) used for conditional GETs.
+        self._etag_cache = {}
+        # used to key the disk cache of slowly changing data per user.
+        self._username = username
+        # cache of observations per (non-spatial) query, used to answer
+        # repeated bounding-box queries locally. See get_observations().
+        self._obs_cache = {}
         self.login(username, password)
 
     def login(self, username: str, password: str) -> requests.models.Response:
@@ -66,9 +102,13 @@ class SensingClues(object):
         url_addition = "auth/logout"
         return self._api_call("post", url_addition, {})
 
+    @disk_cached(ttl=3600)
     def get_groups(self) -> pd.DataFrame:
         """Get overview of groups to which the user has access
 
+        Results are cached on disk for an hour; pass refresh=True to
+        force a fresh fetch.
+
         :returns: Dataframe with available groups
         """
         url_addition = "search/all/facets"
@@ -112,11 +152,31 @@ class SensingClues(object):
             you will also obtain entries for e.g. 'hippo' (which is an
             'animal') if include_subconcepts is True. Default is True.
 
+        Repeated bounding-box queries (via the coord-kwarg) with otherwise
+        identical filters are answered locally: observations fetched for a
+        bounding box are kept in memory and, when a later box falls inside
+        an earlier one, pruned via a spatial index instead of re-downloaded.
+
         :returns: Dataframe with available observations, in line with the
             query parameters specified in kwargs (if any).
         """
         col_trans = {"label": "conceptLabel"}
 
+        coord = kwargs.get("coord", None)
+        cache_key = (
+            str(groups),
+            include_subconcepts,
+            str(sorted((k, str(v)) for k, v in kwargs.items() if k != "coord")),
+        )
+        if coord is not None:
+            cached = self._obs_cache.get(cache_key)
+            if cached is not None and _bbox_contains(cached[0], coord):
+                logger.info(
+                    "Answering bounding-box query from previously "
+                    "fetched observations."
+                )
+                return self._prune_to_bbox(cached[1], coord)
+
         obs = self._iterate_api(
             groups,
             data_type=["observation"],
@@ -131,8 +191,51 @@ class SensingClues(object):
                 obs = obs.loc[obs["conceptId"] == concepts]
 
         obs = obs.rename(columns=col_trans)
+
+        # categorical dtypes turn comparisons and groupbys on these
+        # low-cardinality columns into integer-code operations and
+        # shrink them from one Python string per row to one byte.
+        for col in ("observationType", "conceptLabel"):
+            if col in obs.columns:
+                obs[col] = obs[col].astype("category")
+
+        if (
+            coord is not None
+            and "where" in obs.columns
+            and not obs.empty
+            and obs["where"].notna().all()
+        ):
+            geometry = geopandas.GeoSeries(
+                [shape(where) for where in obs["where"]], index=obs.index
+            )
+            self._obs_cache[cache_key] = (
+                dict(coord),
+                geopandas.GeoDataFrame(obs.copy(), geometry=geometry),
+            )
         return obs
 
+    @staticmethod
+    def _prune_to_bbox(
+        obs: geopandas.GeoDataFrame, coord: dict
+    ) -> pd.DataFrame:
+        """Select cached observations within a bounding box
+
+        Uses the spatial index of the cached GeoDataFrame, whose build
+        cost is amortised over all subsequent bounding-box queries.
+
+        :param obs: Cached GeoDataFrame of observations.
+        :param coord: Dictionary with coordinates specifying the
+            bounding box, with keys north, south, east and west.
+        :returns: Dataframe with the observations inside the box, in the
+            same format as returned by get_observations().
+        """
+        bbox = box(
+            coord["west"], coord["south"], coord["east"], coord["north"]
+        )
+        idx = obs.sindex.query(bbox, predicate="intersects")
+        pruned = obs.iloc[np.sort(idx)].drop(columns="geometry")
+        return pruned.reset_index(drop=True)
+
     def get_tracks(
         self, groups: Union[str, list], precision: int = 6, **kwargs
     ) -> pd.DataFrame:
@@ -175,6 +278,7 @@ class SensingClues(object):
     def add_geojson_to_tracks(
         self,
         tracks: pd.DataFrame,
+        concurrency: int = 1,
     ) -> pd.DataFrame:
         """Add geojson data to track data
 
@@ -183,6 +287,10 @@ class SensingClues(object):
 
         :param tracks:
             Dataframe with available track data.
+        :param concurrency: Number of tracks to fetch geojson-data for
+            concurrently. The per-track requests are independent, so
+            fetching them in parallel overlaps their network latency.
+            Default is 1, in which case tracks are fetched sequentially.
         :returns: Dataframe with geojson-data for each track.
         """
 
@@ -194,8 +302,7 @@ class SensingClues(object):
         else:
             track_entities = tracks["entityId"].unique().tolist()
 
-        df = pd.DataFrame()
-        for i, entity in enumerate(track_entities):
+        def fetch_entity(entity: str) -> pd.DataFrame:
             payload = make_query(query_text=f"entityId:'{entity}'")
             req = self._api_call("post", url_addition, payload)
             df_entity = geopandas.read_file(io.BytesIO(req.content))
@@ -203,7 +310,17 @@ class SensingClues(object):
                 logger.debug(f"Found geojson data for track {entity}.")
             else:
                 logger.debug(f"No geojson data found for track {entity}.")
-            df = pd.concat([df, df_entity], ignore_index=True, sort=False)
+            return df_entity
+
+        if concurrency > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                entity_dfs = list(executor.map(fetch_entity, track_entities))
+        else:
+            entity_dfs = [fetch_entity(entity) for entity in track_entities]
+
+        # concatenate once at the end, instead of growing the dataframe
+        # (and re-copying it) on every iteration.
+        df = pd.concat(entity_dfs, ignore_index=True, sort=False)
 
         if not df.empty:
             df = df.rename(columns={"EntityId": "entityId"})
@@ -212,9 +329,13 @@ class SensingClues(object):
 
         return tracks
 
+    @disk_cached(ttl=3600)
     def get_all_layers(self, exclude_pids: list = None) -> pd.DataFrame:
         """Get layers to which the user has access
 
+        Results are cached on disk for an hour; pass refresh=True to
+        force a fresh fetch.
+
         :param exclude_pids: List of pids to exclude, in addition to
             ['track', 'default'], which are always excluded. Default is None,
             in which case exclude_pids is set to ['track', 'default'].
@@ -304,9 +425,13 @@ class SensingClues(object):
 
         return gdf
 
+    @disk_cached(ttl=3600)
     def get_hierarchy(self, scope: str = None) -> pd.DataFrame:
         """Get available concepts and their hierarchy
 
+        Results are cached on disk for an hour; pass refresh=True to
+        force a fresh fetch.
+
         :param scope: Scope of hierarchy. Must be one of ["WITS", "SCCSS"].
             Default is None, in which case the full hierarchy is returned.
         :returns: Dataframe with available concepts in their hierarchy
@@ -382,6 +507,11 @@ class SensingClues(object):
 
         This method can be called by all methods available in SensingClues
 
+        For 'get'-requests, responses carrying an ETag are cached. On a
+        repeat call the ETag is sent along as If-None-Match, so Focus can
+        reply with 304 Not Modified, in which case the cached response is
+        returned without transferring the body again.
+
         :param action: Type of request, currently 'post' or 'get'.
         :param url_addition: Suffix to base url. Depends on the data requested.
         :param payload: Arguments to be added to the request, such as
@@ -399,11 +529,20 @@ class SensingClues(object):
         err_msg = f"action must be in {ALLOWED_REQUEST_TYPES}, but is {action}"
         assert action in ALLOWED_REQUEST_TYPES, err_msg
 
+        cached = self._etag_cache.get(url) if action == "get" else None
+        if cached:
+            extra_args["headers"]["If-None-Match"] = cached[0]
+
         req = request_trans[action](url, **extra_args)
+        if cached and req.status_code == 304:
+            logger.debug(f"Response for {url} not modified, using cache.")
+            return cached[1]
+
         # add extra status codes
         if req.status_code == 200:
             # successful request
-            pass
+            if action == "get" and "ETag" in req.headers:
+                self._etag_cache[url] = (req.headers["ETag"], req)
         elif req.status_code == 204:
             logger.info(f"Request to {url}, successful logout.")
         elif req.status_code == 401:
@@ -435,6 +574,7 @@ class SensingClues(object):
         extractor_name: str,
         page_nbr_sample: int = None,
         page_length: int = 10,
+        concurrency: int = 1,
         **kwargs,
     ) -> pd.DataFrame:
         """Make iterative calls to SensingClues Focus API to collect data
@@ -448,6 +588,10 @@ class SensingClues(object):
 
         :param page_length: Length of a page, corresponding to the number
             of unique entityId's to extract. Default is 10.
+        :param concurrency: Number of pages to fetch concurrently. Since
+            each page is an independent request, fetching them in parallel
+            overlaps the network latency per page. Default is 1, in which
+            case pages are fetched sequentially.
         :returns: Dataframe with requested data.
         """
         output_data = []
@@ -479,20 +623,34 @@ class SensingClues(object):
 
             # extract the data
             logger.info("Started reading available records.")
-            for i_page in range(nbr_pages):
-                if np.mod(i_page, nbr_pages_decile) == 0:
-                    logger.info(
-                        f"Reading page {i_page:>3d} out of {nbr_pages} pages."
-                    )
-                query = make_query(
+
+            def fetch_page(i_page: int) -> list:
+                query_page = make_query(
                     groups=groups,
                     page_length=page_length,
                     page_nbr=i_page,
                     **kwargs,
                 )
-                req = self._api_call("post", "search/all/results", query)
-                data = extractor.extract_data(req.json())
-                output_data.extend(data)
+                req_page = self._api_call(
+                    "post", "search/all/results", query_page
+                )
+                return extractor.extract_data(req_page.json())
+
+            if concurrency > 1:
+                # pages are independent requests, so fetch them in
+                # parallel on the pooled session. map() preserves the
+                # page order in the output.
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    for data in executor.map(fetch_page, range(nbr_pages)):
+                        output_data.extend(data)
+            else:
+                for i_page in range(nbr_pages):
+                    if np.mod(i_page, nbr_pages_decile) == 0:
+                        logger.info(
+                            f"Reading page {i_page:>3d} "
+                            f"out of {nbr_pages} pages."
+                        )
+                    output_data.extend(fetch_page(i_page))
             logger.info("Finished reading available records.")
         else:
             logger.warning(
@@ -500,5 +658,7 @@ class SensingClues(object):
                 " returning empty dataframe."
             )
 
-        df = pd.DataFrame(output_data)
+        # pages accumulate as plain records; the dataframe (with one
+        # dtype inference pass) is only built once, at the very end.
+        df = pd.DataFrame.from_records(output_data)
         return df
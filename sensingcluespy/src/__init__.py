@@ -2,10 +2,13 @@
 
 """wildcat-api-python source modules"""
 
+from .cache import disk_cached
 from .data_cleaner import flatten_list, get_list_values, select_columns
 from .data_extractor import DataExtractor
 from .helper_functions import (
+    HierarchyIndex,
     align_extractor,
+    build_hierarchy_index,
     check_coordinates,
     check_nested_dict,
     filter_dataframe,
@@ -22,9 +25,11 @@ from .helper_functions import (
 
 __all__ = [
     "align_extractor",
+    "build_hierarchy_index",
     "check_coordinates",
     "check_nested_dict",
     "DataExtractor",
+    "disk_cached",
     "filter_dataframe",
     "flatten_list",
     "get_children_for_label",
@@ -34,6 +39,7 @@ __all__ = [
     "get_list_values",
     "get_parent_for_label",
     "get_parent_for_id",
+    "HierarchyIndex",
     "make_nested_dict",
     "make_query",
     "recursive_get_from_dict",
@@ -0,0 +1,95 @@
+"""Disk-backed caching for slowly changing SensingClues data"""
+
+import hashlib
+import time
+from functools import wraps
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from sensingcluespy import sclogging
+
+logger = sclogging.get_sc_logger()
+
+DEFAULT_CACHE_DIR = Path("~/.cache/sensingcluespy")
+
+
+def _restore_list_cells(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert numpy-array cells back to lists after a parquet read
+
+    Parquet stores list-valued columns natively, but read_parquet
+    returns their cells as numpy arrays. Converting them back keeps
+    cached results indistinguishable from freshly fetched ones.
+
+    :param df: Dataframe loaded from a parquet cache entry.
+    :returns: The dataframe with array cells converted to lists.
+    """
+    for col in df.columns[df.dtypes == object]:
+        df[col] = df[col].map(
+            lambda value: (
+                value.tolist() if isinstance(value, np.ndarray) else value
+            )
+        )
+    return df
+
+
+def disk_cached(ttl: int = 3600):
+    """Cache the dataframe returned by a SensingClues-method on disk
+
+    The cache entry is keyed on the method name, its arguments and the
+    user, and stored in parquet-format under ~/.cache/sensingcluespy,
+    so a repeat call loads the dataframe from disk instead of making a
+    network round trip and rebuilding the dataframe from JSON. Entries
+    older than ttl seconds are refetched. Decorated methods accept an
+    extra keyword argument refresh, which bypasses the cache when True.
+
+    Caching requires a parquet-engine (e.g. pyarrow); without one, the
+    decorated method simply always fetches.
+
+    :param ttl: Lifetime of a cache entry in seconds. Default is 3600.
+    :returns: Decorator for dataframe-returning SensingClues-methods.
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, refresh: bool = False, **kwargs):
+            key_input = repr(
+                (
+                    method.__name__,
+                    getattr(self, "_username", None),
+                    args,
+                    sorted(kwargs.items()),
+                )
+            )
+            key = hashlib.sha256(key_input.encode("utf-8")).hexdigest()[:16]
+            cache_path = (
+                DEFAULT_CACHE_DIR / f"{method.__name__}_{key}.parquet"
+            ).expanduser()
+
+            cache_is_fresh = (
+                cache_path.exists()
+                and time.time() - cache_path.stat().st_mtime < ttl
+            )
+            if cache_is_fresh and not refresh:
+                try:
+                    df = pd.read_parquet(cache_path)
+                    logger.debug(
+                        f"Loaded {method.__name__}-data from {cache_path}."
+                    )
+                    return _restore_list_cells(df)
+                except (ImportError, OSError, ValueError):
+                    # unreadable cache entry; fall through to a fetch.
+                    pass
+
+            df = method(self, *args, **kwargs)
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                df.to_parquet(cache_path)
+            except (ImportError, OSError, ValueError) as err:
+                logger.debug(f"Could not cache to {cache_path}: {err}.")
+            return df
+
+        return wrapper
+
+    return decorator
@@ -3,6 +3,8 @@
 import copy
 import operator as python_ops
 import warnings
+import weakref
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Union
 
@@ -72,34 +74,142 @@ def filter_dataframe(df: pd.DataFrame, filters: dict, return_col: str) -> Any:
         return None
 
 
-def get_children_for_id(df: pd.DataFrame, ontology_id: str) -> Any:
+@dataclass(frozen=True)
+class HierarchyIndex:
+    """Precomputed lookup tables for a concept hierarchy
+
+    Built from a hierarchy-dataframe by build_hierarchy_index(). Each
+    table is a plain dict, so repeated lookups are O(1) instead of a
+    scan of the full dataframe per call.
+    """
+
+    label_by_id: dict
+    id_by_label: dict
+    children_by_id: dict
+    parent_by_id: dict
+
+
+def _none_if_missing(value):
+    """Normalize a missing children/parent cell to None
+
+    Leaf and root concepts carry NaN in these cells; the dataframe-based
+    lookup path drops those via dropna() and returns None, so the index
+    stores None as well instead of a truthy NaN. Filled cells can be
+    lists, but also numpy arrays when the hierarchy was round-tripped
+    through parquet, so anything list-like is kept as-is.
+    """
+    if not pd.api.types.is_list_like(value) and pd.isna(value):
+        return None
+    return value
+
+
+def build_hierarchy_index(hierarchy: pd.DataFrame) -> HierarchyIndex:
+    """Build dict-based lookup tables for a hierarchy-dataframe
+
+    The resulting index can be passed to the get_*_for_id- and
+    get_*_for_label-functions instead of the hierarchy-dataframe itself,
+    which is much faster when performing many lookups.
+
+    :param hierarchy: Dataframe with the concept hierarchy, as returned
+        by SensingClues.get_hierarchy().
+    :returns: HierarchyIndex with lookup tables per id and per label.
+    """
+    label_by_id = {}
+    id_by_label = {}
+    children_by_id = {}
+    parent_by_id = {}
+    for row in hierarchy.itertuples(index=False):
+        label_by_id[row.id] = row.label
+        # in line with filter_dataframe, keep the first match per label.
+        id_by_label.setdefault(row.label, row.id)
+        children_by_id[row.id] = _none_if_missing(row.children)
+        parent_by_id[row.id] = _none_if_missing(row.parent)
+
+    return HierarchyIndex(
+        label_by_id=label_by_id,
+        id_by_label=id_by_label,
+        children_by_id=children_by_id,
+        parent_by_id=parent_by_id,
+    )
+
+
+# memo of id(dataframe) -> (weak reference, HierarchyIndex), so repeated
+# lookups on the same hierarchy-dataframe reuse one index. Weak
+# references keep the cache from holding dataframes alive.
+_hierarchy_index_cache = {}
+
+
+def _get_hierarchy_index(hierarchy: pd.DataFrame) -> HierarchyIndex:
+    """Get a memoized HierarchyIndex for a hierarchy-dataframe
+
+    The index is built once per dataframe and reused on later calls.
+    This assumes the hierarchy is not modified after its first lookup,
+    which holds for dataframes returned by get_hierarchy().
+
+    :param hierarchy: Dataframe with the concept hierarchy.
+    :returns: HierarchyIndex for the dataframe.
+    """
+    cached = _hierarchy_index_cache.get(id(hierarchy))
+    if cached is not None and cached[0]() is hierarchy:
+        return cached[1]
+
+    index = build_hierarchy_index(hierarchy)
+    _hierarchy_index_cache[id(hierarchy)] = (weakref.ref(hierarchy), index)
+    return index
+
+
+def get_children_for_id(
+    df: Union[pd.DataFrame, HierarchyIndex], ontology_id: str
+) -> Any:
     """Get children in the hierarchy for a specific ontology id"""
-    return filter_dataframe(df, {"id": ontology_id}, return_col="children")
+    if not isinstance(df, HierarchyIndex):
+        df = _get_hierarchy_index(df)
+    return df.children_by_id.get(ontology_id)
 
 
-def get_children_for_label(df: pd.DataFrame, label: str) -> Any:
+def get_children_for_label(
+    df: Union[pd.DataFrame, HierarchyIndex], label: str
+) -> Any:
     """Get children in the hierarchy for a specific label"""
-    return filter_dataframe(df, {"label": label}, return_col="children")
+    if not isinstance(df, HierarchyIndex):
+        df = _get_hierarchy_index(df)
+    return df.children_by_id.get(df.id_by_label.get(label))
 
 
-def get_id_for_label(df: pd.DataFrame, label: str) -> str:
+def get_id_for_label(
+    df: Union[pd.DataFrame, HierarchyIndex], label: str
+) -> str:
     """Get ontology id for a specific label in the hierarchy"""
-    return filter_dataframe(df, {"label": label}, return_col="id")
+    if not isinstance(df, HierarchyIndex):
+        df = _get_hierarchy_index(df)
+    return df.id_by_label.get(label)
 
 
-def get_label_for_id(df: pd.DataFrame, ontology_id: str) -> str:
+def get_label_for_id(
+    df: Union[pd.DataFrame, HierarchyIndex], ontology_id: str
+) -> str:
     """Get ontology label for a specific ontology id in the hierarchy"""
-    return filter_dataframe(df, {"id": ontology_id}, return_col="label")
+    if not isinstance(df, HierarchyIndex):
+        df = _get_hierarchy_index(df)
+    return df.label_by_id.get(ontology_id)
 
 
-def get_parent_for_id(df: pd.DataFrame, ontology_id: str) -> Any:
+def get_parent_for_id(
+    df: Union[pd.DataFrame, HierarchyIndex], ontology_id: str
+) -> Any:
     """Get parents in the hierarchy for a specific ontology id"""
-    return filter_dataframe(df, {"id": ontology_id}, return_col="parent")
+    if not isinstance(df, HierarchyIndex):
+        df = _get_hierarchy_index(df)
+    return df.parent_by_id.get(ontology_id)
 
 
-def get_parent_for_label(df: pd.DataFrame, label: str) -> Any:
+def get_parent_for_label(
+    df: Union[pd.DataFrame, HierarchyIndex], label: str
+) -> Any:
     """Get parents in the hierarchy for a specific label"""
-    return filter_dataframe(df, {"label": label}, return_col="parent")
+    if not isinstance(df, HierarchyIndex):
+        df = _get_hierarchy_index(df)
+    return df.parent_by_id.get(df.id_by_label.get(label))
 
 
 def make_query(
@@ -0,0 +1,310 @@
+"""Visualization functions for SensingClues data
+
+These functions require folium and matplotlib, which are not installed
+with sensingcluespy itself. Install them separately to use this module
+(``pip install folium matplotlib``).
+"""
+
+import folium
+import matplotlib.pyplot as plt
+import numpy as np
+from folium.plugins import FastMarkerCluster, HeatMap
+from shapely import contains_xy
+from shapely.geometry import box
+
+from sensingcluespy import sclogging
+from sensingcluespy.src.helper_functions import check_coordinates
+
+logger = sclogging.get_sc_logger()
+
+# marker format per observation type. A dict lookup avoids a per-row
+# if/elif chain on observationType in the marker loop, and each entry
+# is a complete folium.Icon keyword set, so the loop passes it on
+# without merging in further options.
+ICON_FMT = {
+    "animal": {"icon": "fa-paw", "color": "orange", "prefix": "fa"},
+    "community": {
+        "icon": "fa-people-group", "color": "darkblue", "prefix": "fa",
+    },
+    "community_work": {
+        "icon": "fa-people-group", "color": "darkblue", "prefix": "fa",
+    },
+    "hwc": {
+        "icon": "fa-triangle-exclamation", "color": "red", "prefix": "fa",
+    },
+    "poi": {"icon": "fa-leaf", "color": "darkgreen", "prefix": "fa"},
+}
+DEFAULT_FMT = {"icon": "fa-circle", "color": "blue", "prefix": "fa"}
+
+# color cycle for tracks and layers, resolved from matplotlib once at
+# import instead of per plotted map.
+_COLORS = np.array(plt.rcParams["axes.prop_cycle"].by_key()["color"])
+
+HEATMAP_GRADIENTS = {
+    "hwc": {0.4: "yellow", 0.65: "orange", 1: "red"},
+    "animal": {0.4: "blue", 0.65: "lime", 1: "green"},
+}
+
+
+def _tree_key(element) -> tuple:
+    """Key describing an element and all its descendants
+
+    Walks the _children of the element recursively, so the key changes
+    whenever an element is added or removed anywhere in the tree.
+    """
+    return tuple(
+        (name, _tree_key(child))
+        for name, child in element._children.items()
+    )
+
+
+class _CachedMap(folium.Map):
+    """folium.Map which caches its rendered HTML
+
+    Folium re-renders the full Jinja2 template every time a map is
+    displayed. The maps built by the plot functions here are usually
+    displayed several times without changing (e.g. when rerunning a
+    notebook cell), so the rendered string is memoized and only rebuilt
+    when elements are added or removed anywhere in the map's tree —
+    including markers added to an existing FeatureGroup.
+    """
+
+    def _repr_html_(self, **kwargs) -> str:
+        cached = getattr(self, "_html_cache", None)
+        if cached is not None and cached[0] == _tree_key(self):
+            return cached[1]
+        html = super()._repr_html_(**kwargs)
+        # the key is taken after rendering, because folium's render
+        # itself adds helper elements to the tree; a pre-render key
+        # would never match the post-render state.
+        self._html_cache = (_tree_key(self), html)
+        return html
+
+
+def _filter_points_in_bbox(observations, coord: dict):
+    """Select observations whose point lies within a bounding box
+
+    The check runs as a single vectorized shapely call on the raw
+    coordinate arrays, instead of a GEOS predicate per geometry.
+
+    :param observations: geopandas.GeoDataFrame with point geometries.
+    :param coord: Dictionary with coordinates specifying the bounding
+        box, with keys north, south, east and west.
+    :returns: The observations inside the bounding box.
+    """
+    check_coordinates(coord)
+    bbox = box(coord["west"], coord["south"], coord["east"], coord["north"])
+    mask = contains_xy(
+        bbox,
+        observations.geometry.x.to_numpy(),
+        observations.geometry.y.to_numpy(),
+    )
+    return observations[mask]
+
+
+def plot_observations(
+    observations,
+    show_heatmap: str = None,
+    cluster: bool = False,
+    coord: dict = None,
+    zoom_start: int = 8,
+) -> folium.Map:
+    """Plot observations on an interactive map
+
+    A marker is added per observation, grouped in a FeatureGroup per
+    observation type. The dataframe is split by observation type in a
+    single groupby pass, whose groups are reused for both the marker
+    loop and the heatmap overlays. Within each group the coordinates
+    and concept labels are extracted as plain arrays once, instead of
+    iterating the dataframe row-by-row with iterrows(), which keeps the
+    marker loop cheap on frames with thousands of observations.
+
+    :param observations: geopandas.GeoDataFrame with observation data,
+        containing a point-geometry column, as well as the columns
+        'observationType' and 'conceptLabel'.
+    :param show_heatmap: Optional heatmap to overlay. Use "all" for a
+        heatmap of all observations, or "hwc_animal" to overlay
+        human-wildlife conflicts (hwc) on animal sightings.
+        Default is None, in which case no heatmap is added.
+    :param cluster: If True, render each observation type with a
+        FastMarkerCluster, which sends the coordinates as one array
+        plus a single JavaScript icon callback, instead of a Marker per
+        observation. This keeps the generated map small and responsive
+        for many thousands of observations. Default is False.
+    :param coord: Optional dictionary with coordinates specifying a
+        bounding box (keys north, south, east and west); only
+        observations inside the box are plotted. Default is None, in
+        which case all observations are plotted.
+    :param zoom_start: Initial zoom level of the map. Default is 8.
+    :returns: folium.Map with the observations.
+    """
+    if coord is not None:
+        observations = _filter_points_in_bbox(observations, coord)
+
+    xs = observations.geometry.x.to_numpy()
+    ys = observations.geometry.y.to_numpy()
+
+    obs_map = _CachedMap(
+        [np.mean(ys), np.mean(xs)],
+        zoom_start=zoom_start,
+        tiles="cartodbpositron",
+    )
+
+    # split the dataframe by observation type once; the groups are
+    # reused for the marker loop and the heatmap overlays, instead of
+    # scanning the observationType column per filter.
+    grouped = dict(
+        list(observations.groupby("observationType", sort=False, observed=True))
+    )
+
+    # only observation types actually present get a FeatureGroup; empty
+    # groups would still emit a layer-control entry and JS init code.
+    feature_groups = {t: folium.FeatureGroup(name=t) for t in grouped}
+    for obs_type, group in grouped.items():
+        fg = feature_groups[obs_type]
+        icon_fmt = ICON_FMT.get(obs_type, DEFAULT_FMT)
+        group_xs = group.geometry.x.to_numpy()
+        group_ys = group.geometry.y.to_numpy()
+        if cluster:
+            # one data array plus a single JavaScript callback per
+            # observation type, instead of a per-marker HTML blob.
+            callback = (
+                "function (row) {"
+                " var icon = L.AwesomeMarkers.icon({"
+                f" icon: '{icon_fmt['icon']}',"
+                f" prefix: '{icon_fmt['prefix']}',"
+                f" markerColor: '{icon_fmt['color']}'}});"
+                " return L.marker(new L.LatLng(row[0], row[1]),"
+                " {icon: icon});"
+                "}"
+            )
+            FastMarkerCluster(
+                np.column_stack([group_ys, group_xs]).tolist(),
+                callback=callback,
+            ).add_to(fg)
+        else:
+            # folium requires a fresh Icon per Marker (each element owns
+            # its parent), so only the Icon itself is built in the loop.
+            group_labels = group["conceptLabel"].to_numpy()
+            for x, y, lbl in zip(group_xs, group_ys, group_labels):
+                folium.Marker(
+                    [y, x], lbl, icon=folium.Icon(**icon_fmt)
+                ).add_to(fg)
+    for fg in feature_groups.values():
+        obs_map.add_child(fg)
+
+    if show_heatmap is not None:
+        if show_heatmap == "all":
+            HeatMap(np.column_stack([ys, xs])).add_to(obs_map)
+        elif show_heatmap == "hwc_animal":
+            for obs_type, gradient in HEATMAP_GRADIENTS.items():
+                group = grouped.get(obs_type)
+                if group is None:
+                    continue
+                HeatMap(
+                    np.column_stack(
+                        [group.geometry.y.to_numpy(),
+                         group.geometry.x.to_numpy()]
+                    ),
+                    gradient=gradient,
+                ).add_to(obs_map)
+        else:
+            raise ValueError(
+                "show_heatmap should be one of ['all', 'hwc_animal'], "
+                f"but is {show_heatmap}."
+            )
+
+    folium.LayerControl().add_to(obs_map)
+    return obs_map
+
+
+def plot_tracks(track_geometry, zoom_start: int = 8) -> folium.Map:
+    """Plot tracks on an interactive map
+
+    Each track is drawn as a polyline through its points, with a color
+    per track. The coordinates of all points are extracted with the
+    vectorized GeoSeries .y/.x accessors in one pass, rather than with
+    a Python lambda per point, and sliced per track from the resulting
+    arrays.
+
+    :param track_geometry: geopandas.GeoSeries with the point geometries
+        of each track, indexed by track. Multi-part geometries are
+        exploded into their individual points.
+    :param zoom_start: Initial zoom level of the map. Default is 8.
+    :returns: folium.Map with one polyline per track.
+    """
+    tracks = track_geometry.explode(index_parts=True)
+
+    ys = tracks.geometry.y.to_numpy()
+    xs = tracks.geometry.x.to_numpy()
+    track_ids = tracks.index.get_level_values(0).to_numpy()
+
+    track_map = _CachedMap(
+        [np.mean(ys), np.mean(xs)],
+        zoom_start=zoom_start,
+        tiles="cartodbpositron",
+    )
+
+    # the exploded points of a track are contiguous, so the coordinate
+    # arrays can be sliced per track at the boundaries between track
+    # ids, without a groupby or an equality scan of the frame per track.
+    _, starts = np.unique(track_ids, return_index=True)
+    latlon = np.column_stack([ys, xs])
+    segments = np.split(latlon, np.sort(starts)[1:])
+    colors = _COLORS[np.arange(len(segments)) % len(_COLORS)]
+    for segment, color in zip(segments, colors):
+        folium.PolyLine(
+            segment.tolist(),
+            color=color,
+            weight=5,
+            opacity=0.8,
+        ).add_to(track_map)
+
+    return track_map
+
+
+def plot_layer(
+    layer,
+    name_col: str = "name",
+    geometry_col: str = "geometry",
+    zoom_start: int = 8,
+) -> folium.Map:
+    """Plot the geometries of a layer on an interactive map
+
+    The layer is grouped by name in a single pass, with one
+    FeatureGroup per unique name. Features sharing a name thus end up
+    in the same group (one toggle in the layer control), instead of
+    each row allocating a fresh FeatureGroup, which would silently
+    overwrite earlier features with the same name.
+
+    :param layer: geopandas.GeoDataFrame with layer features, e.g. as
+        returned by SensingClues.get_layer_features().
+    :param name_col: Column holding the name of each feature.
+        Default is 'name'.
+    :param geometry_col: Column holding the geometries.
+        Default is 'geometry'.
+    :param zoom_start: Initial zoom level of the map. Default is 8.
+    :returns: folium.Map with a toggleable FeatureGroup per layer name.
+    """
+    minx, miny, maxx, maxy = layer[geometry_col].total_bounds
+    poly_map = _CachedMap(
+        [(miny + maxy) / 2, (minx + maxx) / 2],
+        zoom_start=zoom_start,
+        tiles="cartodbpositron",
+    )
+
+    grouped = layer.groupby(name_col, sort=False)
+    colors = _COLORS[np.arange(grouped.ngroups) % len(_COLORS)]
+    for (name, group), color in zip(grouped, colors):
+        fg = folium.FeatureGroup(name=name)
+        # serialize the whole group to one GeoJSON FeatureCollection in
+        # a single vectorized pass, instead of converting each geometry
+        # to a dict separately; one style_function colors its features.
+        folium.GeoJson(
+            group[[geometry_col]].to_json(),
+            style_function=lambda feature, color=color: {"color": color},
+        ).add_to(fg)
+        poly_map.add_child(fg)
+
+    folium.LayerControl().add_to(poly_map)
+    return poly_map
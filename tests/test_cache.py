@@ -0,0 +1,60 @@
+"""Tests for the cache-module"""
+
+import pandas as pd
+import pytest
+
+from sensingcluespy.src import cache
+
+
+class FakeClient:
+    """Minimal stand-in for SensingClues with a cached method"""
+
+    _username = "test_user"
+
+    def __init__(self):
+        self.n_fetches = 0
+
+    @cache.disk_cached(ttl=3600)
+    def get_data(self, scope: str = None) -> pd.DataFrame:
+        self.n_fetches += 1
+        return pd.DataFrame({"id": ["a", "b"], "scope": [scope, scope]})
+
+    @cache.disk_cached(ttl=3600)
+    def get_nested(self) -> pd.DataFrame:
+        self.n_fetches += 1
+        return pd.DataFrame({"id": ["a", "b"], "children": [["b"], None]})
+
+
+@pytest.mark.cache
+def test_disk_cached_reuses_and_refreshes(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(cache, "DEFAULT_CACHE_DIR", tmp_path)
+
+    client = FakeClient()
+    first = client.get_data(scope="SCCSS")
+    second = client.get_data(scope="SCCSS")
+    assert client.n_fetches == 1
+    pd.testing.assert_frame_equal(first, second)
+
+    # a different argument set misses the cache.
+    client.get_data(scope="WITS")
+    assert client.n_fetches == 2
+
+    # refresh bypasses a fresh cache entry.
+    client.get_data(scope="SCCSS", refresh=True)
+    assert client.n_fetches == 3
+
+
+@pytest.mark.cache
+def test_disk_cached_restores_list_cells(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(cache, "DEFAULT_CACHE_DIR", tmp_path)
+
+    client = FakeClient()
+    fresh = client.get_nested()
+    cached = client.get_nested()
+    assert client.n_fetches == 1
+    # list cells come back as lists, not numpy arrays, so cached and
+    # fresh results are indistinguishable.
+    assert isinstance(cached["children"].iloc[0], list)
+    pd.testing.assert_frame_equal(cached, fresh)
@@ -0,0 +1,95 @@
+"""Tests for the hierarchy lookups in the helper_functions-module"""
+
+import unittest
+
+import pandas as pd
+import pytest
+
+from sensingcluespy.src import (
+    build_hierarchy_index,
+    get_children_for_id,
+    get_children_for_label,
+    get_id_for_label,
+    get_label_for_id,
+    get_parent_for_id,
+)
+
+EXAMPLE_HIERARCHY = pd.DataFrame(
+    {
+        "id": ["ontology/1", "ontology/2", "ontology/3"],
+        "parent": [None, ["ontology/1"], ["ontology/1"]],
+        "children": [["ontology/2", "ontology/3"], None, None],
+        "label": ["Animal sighting", "Kite", "Impala"],
+    }
+)
+
+
+@pytest.mark.helper_functions
+class TestHierarchyIndex(unittest.TestCase):
+
+    def test_lookups_match_dataframe_path(self):
+        index = build_hierarchy_index(EXAMPLE_HIERARCHY)
+
+        for oid in EXAMPLE_HIERARCHY["id"]:
+            assert get_label_for_id(index, oid) == get_label_for_id(
+                EXAMPLE_HIERARCHY, oid
+            )
+            assert get_parent_for_id(index, oid) == get_parent_for_id(
+                EXAMPLE_HIERARCHY, oid
+            )
+        for label in EXAMPLE_HIERARCHY["label"]:
+            assert get_id_for_label(index, label) == get_id_for_label(
+                EXAMPLE_HIERARCHY, label
+            )
+
+    def test_children_for_label(self):
+        index = build_hierarchy_index(EXAMPLE_HIERARCHY)
+        assert get_children_for_label(index, "Animal sighting") == [
+            "ontology/2",
+            "ontology/3",
+        ]
+
+    def test_missing_children_and_parent_return_none(self):
+        # from_records turns missing cells into NaN; the index should
+        # return None for those, like the dataframe-based path does.
+        hierarchy = pd.DataFrame.from_records(
+            [
+                {
+                    "id": "ontology/1",
+                    "parent": float("nan"),
+                    "children": ["ontology/2"],
+                    "label": "Animal sighting",
+                },
+                {
+                    "id": "ontology/2",
+                    "parent": ["ontology/1"],
+                    "children": float("nan"),
+                    "label": "Impala",
+                },
+            ]
+        )
+        index = build_hierarchy_index(hierarchy)
+        assert get_children_for_id(index, "ontology/2") is None
+        assert get_parent_for_id(index, "ontology/1") is None
+
+    def test_index_from_parquet_roundtrip(self):
+        # read_parquet returns list cells as numpy arrays; building the
+        # index from such a frame should neither crash on the missing
+        # cells nor change the lookups.
+        pytest.importorskip("pyarrow")
+        import io
+
+        buffer = io.BytesIO()
+        EXAMPLE_HIERARCHY.to_parquet(buffer)
+        restored = pd.read_parquet(io.BytesIO(buffer.getvalue()))
+
+        index = build_hierarchy_index(restored)
+        assert get_parent_for_id(index, "ontology/1") is None
+        assert list(
+            get_children_for_label(index, "Animal sighting")
+        ) == ["ontology/2", "ontology/3"]
+
+    def test_unknown_entries_return_none(self):
+        index = build_hierarchy_index(EXAMPLE_HIERARCHY)
+        assert get_label_for_id(index, "ontology/999") is None
+        assert get_id_for_label(index, "Dodo") is None
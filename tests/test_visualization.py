@@ -0,0 +1,159 @@
+"""Tests for the visualization-module"""
+
+import unittest
+
+import geopandas as gpd
+import pytest
+from shapely.geometry import MultiPoint, Point, Polygon
+
+# folium and matplotlib are optional extras of the visualization-module
+# and not part of the requirements files.
+folium = pytest.importorskip("folium")
+pytest.importorskip("matplotlib")
+
+from sensingcluespy.src import visualization as viz  # noqa: E402
+
+EXAMPLE_OBSERVATIONS = gpd.GeoDataFrame(
+    {
+        "observationType": ["animal", "hwc", "animal"],
+        "conceptLabel": ["Impala", "Conflict", "Giraffe"],
+        "geometry": [
+            Point(25.70, -17.80),
+            Point(25.80, -17.85),
+            Point(25.71, -17.81),
+        ],
+    },
+    crs="EPSG:4326",
+)
+
+
+def count_children(parent, child_cls):
+    return sum(
+        isinstance(child, child_cls) for child in parent._children.values()
+    )
+
+
+@pytest.mark.visualization
+class TestVisualization(unittest.TestCase):
+
+    def test_plot_observations_markers_per_type(self):
+        obs_map = viz.plot_observations(EXAMPLE_OBSERVATIONS)
+        feature_groups = [
+            child
+            for child in obs_map._children.values()
+            if isinstance(child, folium.FeatureGroup)
+        ]
+        markers_per_group = {
+            fg.layer_name: count_children(fg, folium.Marker)
+            for fg in feature_groups
+        }
+        # only the types present in the data get a FeatureGroup.
+        assert sorted(markers_per_group) == ["animal", "hwc"]
+        assert markers_per_group["animal"] == 2
+        assert markers_per_group["hwc"] == 1
+
+    def test_plot_observations_clustered(self):
+        from folium.plugins import FastMarkerCluster
+
+        obs_map = viz.plot_observations(EXAMPLE_OBSERVATIONS, cluster=True)
+        feature_groups = [
+            child
+            for child in obs_map._children.values()
+            if isinstance(child, folium.FeatureGroup)
+        ]
+        clustered = [
+            fg
+            for fg in feature_groups
+            if count_children(fg, FastMarkerCluster) == 1
+        ]
+        assert sorted(fg.layer_name for fg in clustered) == ["animal", "hwc"]
+
+    def test_plot_observations_bbox_filter(self):
+        coord = {
+            "north": -17.79,
+            "south": -17.82,
+            "east": 25.75,
+            "west": 25.65,
+        }
+        obs_map = viz.plot_observations(EXAMPLE_OBSERVATIONS, coord=coord)
+        feature_groups = [
+            child
+            for child in obs_map._children.values()
+            if isinstance(child, folium.FeatureGroup)
+        ]
+        markers_per_group = {
+            fg.layer_name: count_children(fg, folium.Marker)
+            for fg in feature_groups
+        }
+        # the hwc observation lies outside the bounding box.
+        assert markers_per_group["animal"] == 2
+        assert markers_per_group.get("hwc", 0) == 0
+
+    def test_plot_observations_unknown_heatmap(self):
+        with pytest.raises(ValueError):
+            viz.plot_observations(
+                EXAMPLE_OBSERVATIONS, show_heatmap="unknown"
+            )
+
+    def test_plot_tracks_polyline_per_track(self):
+        track_geometry = gpd.GeoSeries(
+            [
+                MultiPoint([(25.70, -17.80), (25.71, -17.81)]),
+                MultiPoint([(25.80, -17.85), (25.81, -17.86)]),
+            ],
+            index=["track_a", "track_b"],
+            name="geometry",
+            crs="EPSG:4326",
+        )
+        track_map = viz.plot_tracks(track_geometry)
+        assert count_children(track_map, folium.PolyLine) == 2
+
+    def test_plot_layer_groups_duplicate_names(self):
+        square = Polygon([(25.7, -17.8), (25.8, -17.8), (25.8, -17.7)])
+        layer = gpd.GeoDataFrame(
+            {
+                "name": ["zone_a", "zone_a", "zone_b"],
+                "geometry": [square, square, square],
+            },
+            crs="EPSG:4326",
+        )
+        poly_map = viz.plot_layer(layer)
+        feature_groups = [
+            child
+            for child in poly_map._children.values()
+            if isinstance(child, folium.FeatureGroup)
+        ]
+        # duplicate names share one group; no geometries are dropped.
+        assert sorted(fg.layer_name for fg in feature_groups) == [
+            "zone_a",
+            "zone_b",
+        ]
+        # each group holds one GeoJson child with all its features.
+        features_per_group = {}
+        for fg in feature_groups:
+            (geojson,) = [
+                child
+                for child in fg._children.values()
+                if isinstance(child, folium.GeoJson)
+            ]
+            features_per_group[fg.layer_name] = len(
+                geojson.data["features"]
+            )
+        assert features_per_group == {"zone_a": 2, "zone_b": 1}
+
+    def test_repeated_display_reuses_rendered_html(self):
+        obs_map = viz.plot_observations(EXAMPLE_OBSERVATIONS)
+        first = obs_map._repr_html_()
+        assert obs_map._repr_html_() is first
+        # adding a child invalidates the cached render.
+        folium.Marker([-17.80, 25.70]).add_to(obs_map)
+        second = obs_map._repr_html_()
+        assert second is not first
+        # so does adding a marker to a nested, existing FeatureGroup.
+        fg = next(
+            child
+            for child in obs_map._children.values()
+            if isinstance(child, folium.FeatureGroup)
+        )
+        folium.Marker([-17.81, 25.71]).add_to(fg)
+        assert obs_map._repr_html_() is not second